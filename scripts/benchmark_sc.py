@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+
+from siliconcompiler import Chip
+import argparse
+import time
+from siliconcompiler.targets import asap7_demo
+
+
+def _timeit(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return time.perf_counter() - start
+
+
+def _report(name, count, duration):
+    print(f'  {name}: {count / duration:,.0f} ops/s ({1e6 * duration / count:.2f} us/op)')
+
+
+def _loaded_chip():
+    chip = Chip('bench')
+    chip.use(asap7_demo)
+    return chip
+
+
+def run_schema_get(repeat):
+    chip = _loaded_chip()
+    schema = chip.schema
+
+    keypaths = [
+        ('option', 'flow'),
+        ('design',),
+        ('flowgraph', 'asicflow', 'cts.clock_tree_synthesis', '0', 'weight', 'nets'),
+        ('flowgraph', 'asicflow', 'floorplan.power_grid', '0', 'input'),
+        ('library', 'asap7sc7p5t_rvt', 'package', 'source', 'lambdapdk', 'ref'),
+        ('library', 'asap7sc7p5t_slvt', 'output', 'fast', 'spice'),
+        ('pdk', 'asap7', 'foundry'),
+        ('asic', 'logiclib')
+    ]
+
+    def do_get():
+        for key in keypaths:
+            schema.get(*key, field='type')
+
+    duration = _timeit(do_get, repeat)
+    _report('Schema.get', repeat * len(keypaths), duration)
+
+    def do_chip_get():
+        for key in keypaths:
+            chip.get(*key, field='type')
+
+    duration = _timeit(do_chip_get, repeat)
+    _report('Chip.get', repeat * len(keypaths), duration)
+
+
+def run_schema_set(repeat):
+    chip = _loaded_chip()
+    schema = chip.schema
+
+    def do_set():
+        schema.set('option', 'jobname', 'job0')
+        schema.set('metric', 'cellarea', 10.0, step='syn', index='0')
+        schema.set('tool', 'openroad', 'task', 'place', 'var', 'place_density', '0.5')
+
+    duration = _timeit(do_set, repeat)
+    _report('Schema.set', 3 * repeat, duration)
+
+
+def run_schema_copy(repeat):
+    chip = _loaded_chip()
+    schema = chip.schema
+
+    repeat = max(1, repeat // 100)
+
+    duration = _timeit(schema.copy, repeat)
+    _report('Schema.copy', repeat, duration)
+
+    def do_copy_set():
+        schema.copy().set('option', 'jobname', 'job0')
+
+    duration = _timeit(do_copy_set, repeat)
+    _report('Schema.copy + set', repeat, duration)
+
+
+if __name__ == "__main__":
+    tests = {
+        'schema_get': run_schema_get,
+        'schema_set': run_schema_set,
+        'schema_copy': run_schema_copy,
+        'all': None
+    }
+
+    parser = argparse.ArgumentParser(
+        description='Utility tool to benchmark SiliconCompiler operations')
+    parser.add_argument(
+        '--benchmark',
+        choices=tests.keys(),
+        default='all',
+        help='Benchmark to run')
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=10000,
+        help='Number of iterations per benchmark')
+
+    args = parser.parse_args()
+
+    test_set = args.benchmark
+    if test_set == 'all':
+        test_set = [t for t in tests.keys() if t != 'all']
+    else:
+        test_set = [test_set]
+
+    for test in test_set:
+        print(f'Running {test}')
+        tests[test](args.repeat)
@@ -702,14 +702,11 @@ class Chip:
 
         importname = module.design
 
-        src_cfg = self.schema.cfg[group]
-
-        if importname in src_cfg:
+        if importname in self.schema.cfg[group]:
             self.logger.warning(f'Overwriting existing {group} {importname}')
-            del src_cfg[importname]
 
         # Copy
-        src_cfg[importname] = module.getdict(group, importname)
+        self.schema._set_subtree(group, importname, cfg=module.getdict(group, importname))
         self.__import_data_sources(module.schema.cfg)
 
     ###########################################################################
@@ -2008,21 +2005,21 @@ class Chip:
         '''Helper to import library with config 'libconfig' as a library
         'libname' in current Chip object.'''
         if job:
-            cfg = self.schema.cfg['history'][job]['library']
+            libpath = ('history', job, 'library')
         else:
-            cfg = self.schema.cfg['library']
+            libpath = ('library',)
 
         if 'library' in libcfg:
             for sublib_name, sublibcfg in libcfg['library'].items():
                 self.__import_library(sublib_name, sublibcfg,
                                       job=job, clobber=clobber, keep_input=keep_input)
 
-        if libname in cfg:
+        if libname in self.schema.getkeys(*libpath):
             if not clobber:
                 return
 
         self.__import_data_sources(libcfg)
-        cfg[libname] = {}
+        cfg = {}
 
         # Only keep some sections to avoid recursive bloat
         keeps = ['asic', 'design', 'fpga', 'option', 'output', 'package']
@@ -2030,7 +2027,8 @@ class Chip:
             keeps.append('input')
         for section in list(libcfg.keys()):
             if section in keeps:
-                cfg[libname][section] = copy.deepcopy(libcfg[section])
+                cfg[section] = copy.deepcopy(libcfg[section])
+        self.schema._set_subtree(*libpath, libname, cfg=cfg)
 
     ###########################################################################
     def write_flowgraph(self, filename, flow=None,
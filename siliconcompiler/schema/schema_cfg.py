@@ -12,6 +12,40 @@ except ImportError:
 
 SCHEMA_VERSION = '0.48.6'
 
+# Interned static parameter metadata (help, shorthelp, example, switch, enum).
+# These are identical for every schema instance, so all parameters created by
+# scparam() share the same objects instead of holding a private copy each.
+# Shared lists must never be modified in place.
+_STATIC_METADATA = {}
+_TRIMMED_HELP = {}
+
+
+def _intern_metadata(value):
+    if value is None:
+        return None
+
+    if isinstance(value, list):
+        if not all(isinstance(v, str) for v in value):
+            return value
+        key = tuple(value)
+    else:
+        key = value
+
+    if key not in _STATIC_METADATA:
+        if isinstance(value, list):
+            _STATIC_METADATA[key] = [_intern_metadata(v) for v in value]
+        else:
+            _STATIC_METADATA[key] = value
+    return _STATIC_METADATA[key]
+
+
+def _trim_help(schelp):
+    if schelp not in _TRIMMED_HELP:
+        # removing leading spaces as if schelp were a docstring
+        _TRIMMED_HELP[schelp] = _intern_metadata(trim(schelp))
+    return _TRIMMED_HELP[schelp]
+
+
 #############################################################################
 # PARAM DEFINITION
 #############################################################################
@@ -64,8 +98,7 @@ def scparam(cfg,
                 pernode=pernode)
     else:
 
-        # removing leading spaces as if schelp were a docstring
-        schelp = trim(schelp)
+        schelp = _trim_help(schelp)
 
         # setting values based on types
         # note (bools are never lists)
@@ -85,9 +118,9 @@ def scparam(cfg,
         cfg['lock'] = lock
         if switch and not isinstance(switch, list):
             switch = [switch]
-        cfg['switch'] = switch
-        cfg['shorthelp'] = shorthelp
-        cfg['example'] = example
+        cfg['switch'] = _intern_metadata(switch)
+        cfg['shorthelp'] = _intern_metadata(shorthelp)
+        cfg['example'] = _intern_metadata(example)
         cfg['help'] = schelp
         cfg['notes'] = notes
         # never, optional, required
@@ -99,7 +132,7 @@ def scparam(cfg,
         cfg['node']['default']['default']['signature'] = signature
 
         if enum is not None:
-            cfg['enum'] = enum
+            cfg['enum'] = _intern_metadata(enum)
 
         # unit for floats/ints
         if unit is not None:
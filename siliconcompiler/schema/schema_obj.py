@@ -97,6 +97,31 @@ class Schema:
         else:
             self.cfg = self._init_schema_cfg()
 
+    ###########################################################################
+    @property
+    def cfg(self):
+        '''Schema configuration dictionary.'''
+        return self.__cfg
+
+    @cfg.setter
+    def cfg(self, cfg):
+        self.__cfg = cfg
+        # None when every dictionary in cfg is exclusively owned by this schema,
+        # otherwise maps id() to the dictionaries that are owned.
+        self.__owned = None
+        self._clear_index()
+
+    ###########################################################################
+    def _clear_index(self):
+        '''
+        Clears the keypath index.
+
+        This must be called whenever a subtree of the configuration dictionary
+        is replaced or deleted outside of set()/add().
+        '''
+        # Maps complete keypath tuples to leaf dictionaries in cfg
+        self.__index = {}
+
     ###########################################################################
     def _init_schema_cfg(self):
         return schema_cfg()
@@ -215,7 +240,10 @@ class Schema:
 
         if 'history' in self.cfg:
             # Copy over history
-            new_schema.cfg['history'] = self.cfg['history']
+            if self.__owned is None:
+                new_schema.cfg['history'] = self.cfg['history']
+            else:
+                new_schema.cfg['history'] = copy.deepcopy(self.cfg['history'])
 
         self.cfg = new_schema.cfg
 
@@ -440,7 +468,8 @@ class Schema:
                     cfg['node']['default']['default'])
             cfg['node'][modified_step][modified_index][field].extend(value)
         else:
-            cfg[field].extend(value)
+            # Static fields may be shared between schemas, so never extend in place
+            cfg[field] = [*cfg[field], *value]
 
         return True
 
@@ -519,8 +548,8 @@ class Schema:
 
         data = self.getdict(*src)
 
-        cfg = self.__search(*dst[0:-1], insert_defaults=True)
-        cfg[dst[-1]] = data
+        self.__search(*dst[0:-1], insert_defaults=True)
+        self._set_subtree(*dst, cfg=data)
 
     ###########################################################################
     def remove(self, *keypath):
@@ -536,7 +565,7 @@ class Schema:
             self.logger.error(f'Cannot remove default keypath: {keypath}')
             return
 
-        cfg = self.__search(*search_path)
+        cfg = self.__search(*search_path, writable=True)
         if 'default' not in cfg:
             self.logger.error(f'Cannot remove a non-default keypath: {keypath}')
             return
@@ -552,6 +581,7 @@ class Schema:
                 return
 
         del cfg[removal_key]
+        self._clear_index()
         self.__record_journal("remove", keypath)
 
     ###########################################################################
@@ -561,7 +591,7 @@ class Schema:
 
         See :meth:`~siliconcompiler.core.Chip.unset` for detailed documentation.
         '''
-        cfg = self.__search(*keypath)
+        cfg = self.__search(*keypath, writable=True)
 
         if not Schema._is_leaf(cfg):
             raise ValueError(f'Invalid keypath {keypath}: unset() '
@@ -660,6 +690,9 @@ class Schema:
         See :meth:`~siliconcompiler.core.Chip.valid` for detailed
         documentation.
         """
+        if job is None and args in self.__index:
+            return True
+
         keylist = list(args)
         if default_valid:
             default = 'default'
@@ -699,7 +732,7 @@ class Schema:
 
         # initialize new dict
         jobname = self.get('option', 'jobname')
-        self.cfg['history'][jobname] = {}
+        history = {}
 
         # copy in all empty values of scope job
         allkeys = self.allkeys()
@@ -709,9 +742,11 @@ class Schema:
                 scope = self.get(*key, field='scope')
                 if not self.is_empty(*key) and (scope == 'job'):
                     self.__copyparam(self.cfg,
-                                     self.cfg['history'][jobname],
+                                     history,
                                      key)
 
+        self._set_subtree('history', jobname, cfg=history)
+
     @staticmethod
     def __check_and_normalize(value, sc_type, field, keypath, allowed_values):
         '''
@@ -973,11 +1008,29 @@ class Schema:
 
         return None
 
-    def __search(self, *keypath, insert_defaults=False, use_default=True, job=None):
+    def __search(self, *keypath, insert_defaults=False, use_default=True, job=None,
+                 writable=False):
+        # Only dictionaries owned by this schema may be modified, any shared
+        # dictionary along the path is cloned first (see copy()).
+        copy_on_write = (writable or insert_defaults) and self.__owned is not None
+
         if job is not None:
             cfg = self.cfg['history'][job]
         else:
-            cfg = self.cfg
+            try:
+                cfg = self.__index[keypath]
+                if not copy_on_write or id(cfg) in self.__owned:
+                    return cfg
+            except (KeyError, TypeError):
+                pass
+            cfg = self.__cfg
+            if copy_on_write and id(cfg) not in self.__owned:
+                cfg = self.__clone(cfg)
+                self.__cfg = cfg
+
+        # Only keypaths that exist in the configuration are indexed, lookups
+        # that are resolved through 'default' must walk the tree each time.
+        exact = job is None and keypath[:1] != ('history',)
 
         for key in keypath:
             if not isinstance(key, str):
@@ -987,20 +1040,61 @@ class Schema:
                 raise ValueError(f'Invalid keypath {keypath}: unexpected key: {key}')
 
             if key in cfg:
-                cfg = cfg[key]
+                next_key = key
             elif 'default' in cfg:
                 if insert_defaults:
                     cfg[key] = copy.deepcopy(cfg['default'])
-                    cfg = cfg[key]
+                    if copy_on_write:
+                        self.__owned[id(cfg[key])] = cfg[key]
+                    next_key = key
                 elif use_default:
-                    cfg = cfg['default']
+                    next_key = 'default'
+                    exact = False
                 else:
                     raise ValueError(f'Invalid keypath {keypath}: unexpected key: {key}')
             else:
                 raise ValueError(f'Invalid keypath {keypath}: unexpected key: {key}')
 
+            if copy_on_write and id(cfg[next_key]) not in self.__owned:
+                cfg[next_key] = self.__clone(cfg[next_key])
+            cfg = cfg[next_key]
+
+        if exact and Schema._is_leaf(cfg):
+            self.__index[keypath] = cfg
+
+        return cfg
+
+    ###########################################################################
+    def __clone(self, cfg):
+        '''
+        Returns a private copy of a shared dictionary.
+
+        Leaves are copied completely, since set() modifies them in place, while
+        branches are copied one level deep so their children remain shared.
+        '''
+        if Schema._is_leaf(cfg):
+            cfg = copy.deepcopy(cfg)
+        else:
+            cfg = cfg.copy()
+        self.__owned[id(cfg)] = cfg
         return cfg
 
+    ###########################################################################
+    def _set_subtree(self, *keypath, cfg=None):
+        '''
+        Replaces the configuration dictionary at keypath.
+
+        Args:
+            keypath (list str): Keypath to replace, the parent keypath must exist.
+            cfg (dict): New configuration dictionary, this must not be referenced
+                by any other schema.
+        '''
+        parent = self.__search(*keypath[:-1], use_default=False, writable=True)
+        parent[keypath[-1]] = cfg
+        if self.__owned is not None:
+            self.__owned[id(cfg)] = cfg
+        self._clear_index()
+
     ###########################################################################
     def allkeys(self, *keypath_prefix):
         '''
@@ -1147,10 +1241,25 @@ class Schema:
 
     ###########################################################################
     def copy(self):
-        '''Returns deep copy of Schema object.'''
-        newscheme = Schema(cfg=self.cfg)
+        '''Returns copy of Schema object.
+
+        The configuration is shared between both schemas until it is modified,
+        at which point only the modified parameter and its parents are copied.
+        '''
+        newscheme = Schema.__new__(Schema)
+        newscheme._init_record_access()
+        newscheme._init_logger()
+        newscheme._stop_journal()
         if self.__journal:
             newscheme.__journal = copy.deepcopy(self.__journal)
+
+        newscheme.__cfg = self.__cfg
+        newscheme.__index = self.__index.copy()
+
+        # Neither schema owns the configuration anymore
+        newscheme.__owned = {}
+        self.__owned = {}
+
         return newscheme
 
     ###########################################################################
@@ -1169,6 +1278,8 @@ class Schema:
         for _ in range(maxdepth):
             self.__prune()
 
+        self._clear_index()
+
     ###########################################################################
     def __prune(self, *keypath):
         '''
@@ -1176,7 +1287,7 @@ class Schema:
         schema (cfg) with only essential non-empty parameters retained.
 
         '''
-        cfg = self.__search(*keypath)
+        cfg = self.__search(*keypath, writable=True)
 
         # Prune when the default & value are set to the following
         # Loop through all keys starting at the top
@@ -1187,9 +1298,9 @@ class Schema:
                 del cfg[k]
             # reached leaf-cell
             elif 'help' in cfg[k].keys():
-                del cfg[k]['help']
+                del self.__search(*keypath, k, writable=True)['help']
             elif 'example' in cfg[k].keys():
-                del cfg[k]['example']
+                del self.__search(*keypath, k, writable=True)['example']
             elif Schema._is_leaf(cfg[k]):
                 pass
             # removing stale branches
@@ -1224,12 +1335,14 @@ class Schema:
             job (str): Name of historical job to return.
         '''
         if job not in self.cfg['history']:
-            self.cfg['history'][job] = self._init_schema_cfg()
+            self._set_subtree('history', job, cfg=self._init_schema_cfg())
 
         # Can't initialize Schema() by passing in cfg since it performs a deep
         # copy.
         schema = Schema()
-        schema.cfg = self.cfg['history'][job]
+        schema.cfg = self.__search('history', job, use_default=False, writable=True)
+        # Share ownership so changes are made in this schema's configuration
+        schema.__owned = self.__owned
         return schema
 
     #######################################
@@ -1256,6 +1369,9 @@ class Schema:
     def __setstate__(self, state):
         self.__dict__ = state
 
+        # The restored configuration is not shared with any other schema
+        self.__owned = None
+
         # Reinitialize logger on restore
         self._init_logger()
 
@@ -1395,7 +1511,7 @@ class Schema:
         '''
         keypath = args[:-1]
         value = args[-1]
-        cfg = self.__search(*keypath)
+        cfg = self.__search(*keypath, writable=True)
 
         if not Schema._is_leaf(cfg):
             raise ValueError(f'Invalid keypath {keypath}: set_default() '
@@ -1847,12 +1963,13 @@ class Schema:
         # Read history, if we're not already reading into a job
         if 'history' in schema.getkeys():
             for historic_job in schema.getkeys('history'):
-                self.cfg['history'][historic_job] = schema.getdict('history', historic_job)
+                self._set_subtree('history', historic_job,
+                                  cfg=schema.getdict('history', historic_job))
 
         # TODO: better way to handle this?
         if 'library' in schema.getkeys():
             for libname in schema.getkeys('library'):
-                self.cfg['library'][libname] = schema.getdict('library', libname)
+                self._set_subtree('library', libname, cfg=schema.getdict('library', libname))
 
     ###########################################################################
     def merge_manifest(self, src, job=None, clobber=True, clear=True, check=False):
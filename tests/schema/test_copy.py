@@ -0,0 +1,106 @@
+import pytest
+
+from siliconcompiler.schema import Schema
+from siliconcompiler import Chip
+from siliconcompiler.targets import asic_demo
+
+
+@pytest.fixture
+def schema():
+    schema = Schema()
+    schema.set('design', 'test')
+    schema.set('option', 'var', 'test', 'value')
+    schema.set('metric', 'cellarea', 10, step='syn', index='0')
+    return schema
+
+
+@pytest.mark.parametrize('modify_copy', [True, False])
+def test_copy_set(schema, modify_copy):
+    schema_copy = schema.copy()
+
+    if modify_copy:
+        target, other = schema_copy, schema
+    else:
+        target, other = schema, schema_copy
+
+    target.set('design', 'new')
+    target.set('option', 'var', 'new', 'value')
+    target.add('option', 'var', 'test', 'value1')
+    target.set('metric', 'cellarea', 20, step='syn', index='0')
+    target.set('metric', 'cellarea', 30, step='syn', index='1')
+
+    assert target.get('design') == 'new'
+    assert target.get('option', 'var', 'new') == ['value']
+    assert target.get('option', 'var', 'test') == ['value', 'value1']
+    assert target.get('metric', 'cellarea', step='syn', index='0') == 20
+    assert target.get('metric', 'cellarea', step='syn', index='1') == 30
+
+    assert other.get('design') == 'test'
+    assert 'new' not in other.getkeys('option', 'var')
+    assert other.get('option', 'var', 'test') == ['value']
+    assert other.get('metric', 'cellarea', step='syn', index='0') == 10
+    assert other.get('metric', 'cellarea', step='syn', index='1') is None
+
+
+def test_copy_unset_remove(schema):
+    schema_copy = schema.copy()
+
+    schema_copy.unset('metric', 'cellarea', step='syn', index='0')
+    schema_copy.remove('option', 'var', 'test')
+    schema_copy.set_default('design', 'default')
+
+    assert schema_copy.get('metric', 'cellarea', step='syn', index='0') is None
+    assert 'test' not in schema_copy.getkeys('option', 'var')
+    assert schema_copy.get_default('design') == 'default'
+
+    assert schema.get('metric', 'cellarea', step='syn', index='0') == 10
+    assert schema.get('option', 'var', 'test') == ['value']
+    assert schema.get_default('design') is None
+
+
+def test_copy_prune(schema):
+    schema_copy = schema.copy()
+    schema_copy.prune()
+
+    assert 'help' not in schema_copy.cfg['design']
+    assert 'default' not in schema_copy.cfg['option']['var']
+
+    assert 'help' in schema.cfg['design']
+    assert 'default' in schema.cfg['option']['var']
+
+
+def test_copy_history(schema):
+    schema_copy = schema.copy()
+
+    schema_copy.set('option', 'jobname', 'job0')
+    schema_copy.record_history()
+    schema_copy.history('job0').set('metric', 'cellarea', 40, step='syn', index='0')
+
+    assert schema_copy.get('metric', 'cellarea', job='job0', step='syn', index='0') == 40
+    assert schema.getkeys('history') == []
+
+
+def test_copy_of_copy(schema):
+    schema_copy0 = schema.copy()
+    schema_copy1 = schema_copy0.copy()
+
+    schema_copy0.set('design', 'copy0')
+    schema_copy1.set('design', 'copy1')
+
+    assert schema.get('design') == 'test'
+    assert schema_copy0.get('design') == 'copy0'
+    assert schema_copy1.get('design') == 'copy1'
+
+
+def test_copy_chip_library():
+    chip = Chip('test')
+    chip.use(asic_demo)
+
+    schema_copy = chip.schema.copy()
+
+    lib = Chip('sky130hd')
+    lib.set('option', 'pdk', 'test')
+    chip.use(lib)
+
+    assert chip.get('library', 'sky130hd', 'option', 'pdk') == 'test'
+    assert schema_copy.get('library', 'sky130hd', 'option', 'pdk') == 'skywater130'
@@ -167,3 +167,61 @@ def test_copy_key_file():
     assert 'test1' not in chip.getkeys('option', 'file')
     chip.schema.copy_key(src=('option', 'file', 'test'), dst=('option', 'file', 'test1'))
     assert chip.find_files('option', 'file', 'test1') == [file_path]
+
+
+def test_index_default_keypath():
+    schema = Schema()
+
+    # Reading through 'default' must not shadow a later insertion
+    assert schema.get('option', 'var', 'test') == []
+    schema.set('option', 'var', 'test', 'value')
+    assert schema.get('option', 'var', 'test') == ['value']
+    assert schema.valid('option', 'var', 'test', check_complete=True)
+
+
+def test_index_remove():
+    schema = Schema()
+
+    schema.set('option', 'var', 'test', 'value')
+    assert schema.get('option', 'var', 'test') == ['value']
+
+    schema.remove('option', 'var', 'test')
+    assert 'test' not in schema.getkeys('option', 'var')
+    assert not schema.valid('option', 'var', 'test')
+    assert schema.get('option', 'var', 'test') == []
+
+
+def test_index_replace_cfg():
+    schema = Schema()
+    schema.set('option', 'var', 'test', 'value')
+    assert schema.get('option', 'var', 'test') == ['value']
+
+    schema.cfg = Schema().cfg
+    assert schema.get('option', 'var', 'test') == []
+
+
+def test_index_copy_key():
+    schema = Schema()
+
+    schema.set('option', 'pdk', 'test')
+    assert schema.get('option', 'stackup') is None
+
+    schema.copy_key(src=('option', 'pdk'), dst=('option', 'stackup'))
+    assert schema.get('option', 'stackup') == 'test'
+
+    schema.set('option', 'stackup', 'other')
+    assert schema.get('option', 'pdk') == 'test'
+    assert schema.get('option', 'stackup') == 'other'
+
+
+def test_index_use_library():
+    chip = Chip('')
+    chip.use(asic_demo)
+
+    assert chip.get('library', 'sky130hd', 'option', 'pdk') == 'skywater130'
+
+    lib = Chip('sky130hd')
+    lib.set('option', 'pdk', 'test')
+    chip.use(lib)
+
+    assert chip.get('library', 'sky130hd', 'option', 'pdk') == 'test'
@@ -112,3 +112,20 @@ def test_defvalue():
 #########################
 if __name__ == "__main__":
     test_scparam()
+
+
+def test_static_metadata_shared():
+    schema0 = Schema()
+    schema1 = Schema()
+
+    for field in ('help', 'example', 'switch'):
+        assert schema0.cfg['option']['flow'][field] is schema1.cfg['option']['flow'][field]
+
+
+def test_static_metadata_add():
+    schema0 = Schema()
+    schema1 = Schema()
+
+    assert schema0.add('option', 'flow', 'api: test', field='example')
+    assert 'api: test' in schema0.get('option', 'flow', field='example')
+    assert 'api: test' not in schema1.get('option', 'flow', field='example')